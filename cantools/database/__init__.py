@@ -1,10 +1,11 @@
 import os
-from typing import Union, Optional, TextIO, MutableMapping, cast
+from typing import Union, Optional, TextIO, MutableMapping, Tuple, cast
 from xml.etree import ElementTree
 
 from .errors import ParseError
 from .errors import Error
 from ..compat import fopen
+from ..version import __version__
 from . import can
 from . import diagnostics
 from . import utils
@@ -79,10 +80,12 @@ def _load_file_cache(filename: StringPathLike,
                      strict: bool,
                      cache_dir: str,
                      ) -> Union[can.Database, diagnostics.Database]:
+    # The cantools version is part of the key as pickled databases can
+    # only be loaded by the version that created them.
     with open(filename, 'rb') as fin:
-        key = fin.read()
+        key = (__version__, fin.read())
 
-    cache: MutableMapping[bytes, Union[can.Database, diagnostics.Database]] = diskcache.Cache(cache_dir)
+    cache: MutableMapping[Tuple[str, bytes], Union[can.Database, diagnostics.Database]] = diskcache.Cache(cache_dir)
 
     try:
         return cache[key]
@@ -309,14 +312,7 @@ def load_string(string: str,
         db = can.Database(frame_id_mask=frame_id_mask,
                           strict=strict)
 
-        if fmt == 'arxml':
-            db.add_arxml_string(string)
-        elif fmt == 'dbc':
-            db.add_dbc_string(string)
-        elif fmt == 'kcd':
-            db.add_kcd_string(string)
-        elif fmt == 'sym':
-            db.add_sym_string(string)
+        db.add_string(string, fmt)
 
         if prune_choices:
             utils.prune_database_choices(db)
@@ -1,3 +1,6 @@
+# Make the formats package available as an attribute. The format
+# modules themselves are imported on first use.
+from . import formats
 from .database import Database
 from .message import Message
 from .message import EncodeError
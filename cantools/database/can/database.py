@@ -1,28 +1,97 @@
+import importlib
+import io
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Dict,
+    Iterable,
     List,
     Optional,
     TextIO,
+    TYPE_CHECKING,
     Union,
+    cast,
 )
 
 from .bus import Bus
-from .formats import arxml
-from .formats import dbc
-from .formats import kcd
-from .formats import sym
-from .formats.arxml import AutosarDatabaseSpecifics
-from .formats.dbc import DbcSpecifics
 from .internal_database import InternalDatabase
 from .message import Message
 from .node import Node
 from ...compat import fopen
 from ...typechecking import StringPathLike
 
+if TYPE_CHECKING:
+    from .formats.arxml import AutosarDatabaseSpecifics
+    from .formats.dbc import DbcSpecifics
+
 LOGGER = logging.getLogger(__name__)
 
 
+def _check_frame_id_or_name(frame_id_or_name: Union[int, str]) -> None:
+    """Raise an exception if given frame id or name has an invalid type.
+
+    """
+
+    if not isinstance(frame_id_or_name, (int, str)):
+        raise ValueError(f"Invalid frame_id_or_name '{frame_id_or_name}'")
+
+
+def _intern_name(name: str) -> str:
+    """Return given message name interned, unless it is of a subclass of
+    str, which cannot be interned.
+
+    """
+
+    if type(name) is str:
+        return sys.intern(name)
+    else:
+        return name
+
+
+# Marks the end of the datas given to Database.decode_many().
+_MISSING = object()
+
+
+# Database formats that can be added to a database, and the default
+# encodings of their files.
+_DEFAULT_ENCODINGS = {
+    'arxml': 'utf-8',
+    'dbc': 'cp1252',
+    'kcd': 'utf-8',
+    'sym': 'utf-8'
+}
+
+
+def _check_database_format(database_format: str) -> None:
+    """Raise an exception if given database format can not be added to a
+    database.
+
+    """
+
+    if database_format not in _DEFAULT_ENCODINGS:
+        raise ValueError(
+            "expected database format 'arxml', 'dbc', 'kcd' or 'sym', but "
+            "got '{}'".format(database_format))
+
+
+def _read_files(filenames: List[StringPathLike], encoding: str) -> List[str]:
+    """Read given files concurrently and return their contents in the same
+    order.
+
+    """
+
+    def read(filename: StringPathLike) -> str:
+        with fopen(filename, 'r', encoding=encoding) as fin:
+            return cast(TextIO, fin).read()
+
+    if len(filenames) < 2:
+        return [read(filename) for filename in filenames]
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(read, filenames))
+
+
 class Database(object):
     """This class contains all messages, signals and definitions of a CAN
     network.
@@ -37,13 +106,30 @@ class Database(object):
 
     """
 
+    __slots__ = (
+        '_messages',
+        '_nodes',
+        '_buses',
+        '_name_to_message',
+        '_frame_id_to_message',
+        '_lookup',
+        '_name_to_node',
+        '_name_to_bus',
+        '_version',
+        '_dbc',
+        '_autosar',
+        '_frame_id_mask',
+        '_mask_needed',
+        '_strict'
+    )
+
     def __init__(self,
                  messages: Optional[List[Message]] = None,
                  nodes: Optional[List[Node]] = None,
                  buses: Optional[List[Bus]] = None,
                  version: Optional[str] = None,
-                 dbc_specifics: Optional[DbcSpecifics] = None,
-                 autosar_specifics: Optional[AutosarDatabaseSpecifics] = None,
+                 dbc_specifics: Optional["DbcSpecifics"] = None,
+                 autosar_specifics: Optional["AutosarDatabaseSpecifics"] = None,
                  frame_id_mask: Optional[int] = None,
                  strict: bool = True,
                  ) -> None:
@@ -52,6 +138,9 @@ class Database(object):
         self._buses = buses or []
         self._name_to_message: Dict[str, Message] = {}
         self._frame_id_to_message: Dict[int, Message] = {}
+        self._lookup: Dict[Union[int, str], Message] = {}
+        self._name_to_node: Dict[str, Node] = {}
+        self._name_to_bus: Dict[str, Bus] = {}
         self._version = version
         self._dbc = dbc_specifics
         self._autosar = autosar_specifics
@@ -60,8 +149,10 @@ class Database(object):
             frame_id_mask = 0xffffffff
 
         self._frame_id_mask = frame_id_mask
+        # Frame ids are at most 29 bits, so the default mask is a no-op.
+        self._mask_needed = (frame_id_mask != 0xffffffff)
         self._strict = strict
-        self.refresh()
+        self._refresh_all()
 
     @property
     def messages(self) -> List[Message]:
@@ -104,7 +195,7 @@ class Database(object):
         self._version = value
 
     @property
-    def dbc(self) -> Optional[DbcSpecifics]:
+    def dbc(self) -> Optional["DbcSpecifics"]:
         """An object containing dbc specific properties like e.g. attributes.
 
         """
@@ -112,11 +203,11 @@ class Database(object):
         return self._dbc
 
     @dbc.setter
-    def dbc(self, value: Optional[DbcSpecifics]) -> None:
+    def dbc(self, value: Optional["DbcSpecifics"]) -> None:
         self._dbc = value
 
     @property
-    def autosar(self) -> Optional[AutosarDatabaseSpecifics]:
+    def autosar(self) -> Optional["AutosarDatabaseSpecifics"]:
         """An object containing AUTOSAR specific properties like e.g. attributes.
 
         """
@@ -124,7 +215,7 @@ class Database(object):
         return self._autosar
 
     @autosar.setter
-    def autosar(self, value: Optional[AutosarDatabaseSpecifics]) -> None:
+    def autosar(self, value: Optional["AutosarDatabaseSpecifics"]) -> None:
         self._autosar = value
 
     def add_arxml(self, fp: TextIO) -> None:
@@ -133,7 +224,9 @@ class Database(object):
 
         """
 
-        self.add_arxml_string(fp.read())
+        from .formats import arxml
+
+        self._add_internal_database(arxml.load(fp, self._strict), 'arxml')
 
     def add_arxml_file(self,
                        filename: StringPathLike,
@@ -145,24 +238,21 @@ class Database(object):
 
         """
 
+        # Invalid bytes are replaced when reading the file, as in
+        # load_file().
         with fopen(filename, 'r', encoding=encoding) as fin:
             self.add_arxml(fin)
 
-    def add_arxml_string(self, string: str) -> None:
+    def add_arxml_string(self, string: Union[str, bytes]) -> None:
         """Parse given ARXML data string and add the parsed data to the
         database.
 
+        `string` may also be given as bytes, which are decoded by the XML
+        parser as given by the XML declaration.
+
         """
 
-        database = arxml.load_string(string, self._strict)
-
-        self._messages += database.messages
-        self._nodes = database.nodes
-        self._buses = database.buses
-        self._version = database.version
-        self._dbc = database.dbc
-        self._autosar = database.autosar
-        self.refresh()
+        self.add_string(string, 'arxml')
 
     def add_dbc(self, fp: TextIO) -> None:
         """Read and parse DBC data from given file-like object and add the
@@ -192,24 +282,20 @@ class Database(object):
         with fopen(filename, 'r', encoding=encoding) as fin:
             self.add_dbc(fin)
 
-    def add_dbc_string(self, string: str) -> None:
+    def add_dbc_string(self, string: Union[str, bytes]) -> None:
         """Parse given DBC data string and add the parsed data to the
         database.
 
+        `string` may also be given as bytes, which are decoded using
+        the default encoding of :meth:`.add_dbc_file()`.
+
         >>> db = cantools.database.Database()
         >>> with open ('foo.dbc', 'r') as fin:
         ...     db.add_dbc_string(fin.read())
 
         """
 
-        database = dbc.load_string(string, self._strict)
-
-        self._messages += database.messages
-        self._nodes = database.nodes
-        self._buses = database.buses
-        self._version = database.version
-        self._dbc = database.dbc
-        self.refresh()
+        self.add_string(string, 'dbc')
 
     def add_kcd(self, fp: TextIO) -> None:
         """Read and parse KCD data from given file-like object and add the
@@ -217,7 +303,9 @@ class Database(object):
 
         """
 
-        self.add_kcd_string(fp.read())
+        from .formats import kcd
+
+        self._add_internal_database(kcd.load(fp, self._strict), 'kcd')
 
     def add_kcd_file(self,
                      filename: StringPathLike,
@@ -229,23 +317,21 @@ class Database(object):
 
         """
 
+        # Invalid bytes are replaced when reading the file, as in
+        # load_file().
         with fopen(filename, 'r', encoding=encoding) as fin:
             self.add_kcd(fin)
 
-    def add_kcd_string(self, string: str) -> None:
+    def add_kcd_string(self, string: Union[str, bytes]) -> None:
         """Parse given KCD data string and add the parsed data to the
         database.
 
+        `string` may also be given as bytes, which are decoded by the XML
+        parser as given by the XML declaration.
+
         """
 
-        database = kcd.load_string(string, self._strict)
-
-        self._messages += database.messages
-        self._nodes = database.nodes
-        self._buses = database.buses
-        self._version = database.version
-        self._dbc = database.dbc
-        self.refresh()
+        self.add_string(string, 'kcd')
 
     def add_sym(self, fp: TextIO) -> None:
         """Read and parse SYM data from given file-like object and add the
@@ -268,66 +354,169 @@ class Database(object):
         with fopen(filename, 'r', encoding=encoding) as fin:
             self.add_sym(fin)
 
-    def add_sym_string(self, string: str) -> None:
+    def add_sym_string(self, string: Union[str, bytes]) -> None:
         """Parse given SYM data string and add the parsed data to the
         database.
 
+        `string` may also be given as bytes, which are decoded using
+        the default encoding of :meth:`.add_sym_file()`.
+
         """
 
-        database = sym.load_string(string, self._strict)
+        self.add_string(string, 'sym')
+
+    def add_files(self,
+                  filenames: Iterable[StringPathLike],
+                  database_format: str,
+                  encoding: Optional[str] = None) -> None:
+        """Open, read and parse given files and add the parsed data to the
+        database, in the given order. The files are read concurrently,
+        which is faster than adding them one by one when reading takes
+        a long time, for example on network file systems.
+
+        `database_format` is one of ``'arxml'``, ``'dbc'``, ``'kcd'``
+        and ``'sym'``.
+
+        `encoding` specifies the file encoding. If ``None``, the
+        default encoding of the ``add_*_file()`` method of given
+        database format is used.
+
+        >>> db = cantools.database.Database()
+        >>> db.add_files(['foo.dbc', 'bar.dbc'], 'dbc')
+
+        """
+
+        _check_database_format(database_format)
+
+        if encoding is None:
+            encoding = _DEFAULT_ENCODINGS[database_format]
+
+        for string in _read_files(list(filenames), encoding):
+            self.add_string(string, database_format)
 
+    def add_string(self,
+                   string: Union[str, bytes],
+                   database_format: str) -> None:
+        """Parse given data string of given database format and add the
+        parsed data to the database.
+
+        `database_format` is one of ``'arxml'``, ``'dbc'``, ``'kcd'``
+        and ``'sym'``.
+
+        `string` may also be given as bytes. ARXML and KCD bytes are
+        decoded by the XML parser as given by the XML declaration. DBC
+        and SYM bytes are decoded using the default encoding of
+        :meth:`.add_dbc_file()` and :meth:`.add_sym_file()`
+        respectively.
+
+        >>> db = cantools.database.Database()
+        >>> with open ('foo.dbc', 'r') as fin:
+        ...     db.add_string(fin.read(), 'dbc')
+
+        """
+
+        _check_database_format(database_format)
+
+        if isinstance(string, bytes) and database_format in ['dbc', 'sym']:
+            # Only the XML parsers accept bytes.
+            string = string.decode(_DEFAULT_ENCODINGS[database_format],
+                                   errors='replace')
+
+        module = importlib.import_module('.formats.' + database_format,
+                                         __package__)
+        self._add_internal_database(module.load_string(string, self._strict),
+                                    database_format)
+
+    def _add_internal_database(self,
+                               database: InternalDatabase,
+                               database_format: str) -> None:
+        """Add given parsed database of given format to the database.
+
+        """
+
+        is_empty = not self._messages
         self._messages += database.messages
         self._nodes = database.nodes
         self._buses = database.buses
+        self._refresh_nodes_and_buses()
         self._version = database.version
         self._dbc = database.dbc
-        self.refresh()
+
+        if database_format == 'arxml':
+            self._autosar = database.autosar
+
+        # The parsers create the messages with the same strictness as
+        # the database, and messages refresh themselves when created, so
+        # only the lookup tables have to be updated.
+        if is_empty:
+            self._build_message_lookup_tables()
+        else:
+            for message in database.messages:
+                self._add_message(message)
 
     def _add_message(self, message: Message) -> None:
         """Add given message to the database.
 
         """
 
-        if message.name in self._name_to_message:
+        name = _intern_name(message.name)
+        previous_message = self._name_to_message.get(name)
+
+        if previous_message is not None:
             LOGGER.warning("Overwriting message '%s' with '%s' in the "
                            "name to message dictionary.",
-                           self._name_to_message[message.name].name,
+                           previous_message.name,
                            message.name)
 
-        masked_frame_id = (message.frame_id & self._frame_id_mask)
+        if self._mask_needed:
+            masked_frame_id = (message.frame_id & self._frame_id_mask)
+        else:
+            masked_frame_id = message.frame_id
 
-        if masked_frame_id in self._frame_id_to_message:
+        previous_message = self._frame_id_to_message.get(masked_frame_id)
+
+        if previous_message is not None:
             LOGGER.warning(
                 "Overwriting message '%s' with '%s' in the frame id to message "
                 "dictionary because they have identical masked frame ids 0x%x.",
-                self._frame_id_to_message[masked_frame_id].name,
+                previous_message.name,
                 message.name,
                 masked_frame_id)
 
-        self._name_to_message[message.name] = message
+        self._name_to_message[name] = message
         self._frame_id_to_message[masked_frame_id] = message
+        self._lookup[name] = message
+        self._lookup[masked_frame_id] = message
 
     def as_dbc_string(self) -> str:
         """Return the database as a string formatted as a DBC file.
 
         """
 
-        return dbc.dump_string(InternalDatabase(self._messages,
-                                                self._nodes,
-                                                self._buses,
-                                                self._version,
-                                                self._dbc))
+        from .formats import dbc
+
+        return dbc.dump_string(self._as_internal_database())
 
     def as_kcd_string(self) -> str:
         """Return the database as a string formatted as a KCD file.
 
         """
 
-        return kcd.dump_string(InternalDatabase(self._messages,
-                                                self._nodes,
-                                                self._buses,
-                                                self._version,
-                                                self._dbc))
+        from .formats import kcd
+
+        return kcd.dump_string(self._as_internal_database())
+
+    def _as_internal_database(self) -> InternalDatabase:
+        """Return the database contents as an internal database for the
+        dump functions.
+
+        """
+
+        return InternalDatabase(self._messages,
+                                self._nodes,
+                                self._buses,
+                                self._version,
+                                self._dbc)
 
     def get_message_by_name(self, name: str) -> Message:
         """Find the message object for given name `name`.
@@ -341,29 +530,42 @@ class Database(object):
 
         """
 
-        return self._frame_id_to_message[frame_id & self._frame_id_mask]
+        if self._mask_needed:
+            frame_id &= self._frame_id_mask
+
+        return self._frame_id_to_message[frame_id]
 
     def get_node_by_name(self, name: str) -> Node:
         """Find the node object for given name `name`.
 
         """
 
-        for node in self._nodes:
-            if node.name == name:
-                return node
+        try:
+            return self._name_to_node[name]
+        except KeyError:
+            # The node may have been added to the node list after the
+            # last refresh.
+            for node in self._nodes:
+                if node.name == name:
+                    return node
 
-        raise KeyError(name)
+            raise
 
     def get_bus_by_name(self, name: str) -> Bus:
         """Find the bus object for given name `name`.
 
         """
 
-        for bus in self._buses:
-            if bus.name == name:
-                return bus
+        try:
+            return self._name_to_bus[name]
+        except KeyError:
+            # The bus may have been added to the bus list after the
+            # last refresh.
+            for bus in self._buses:
+                if bus.name == name:
+                    return bus
 
-        raise KeyError(name)
+            raise
 
     def encode_message(self,
                        frame_id_or_name: Union[int, str],
@@ -390,12 +592,17 @@ class Database(object):
 
         """
 
-        if isinstance(frame_id_or_name, int):
-            message = self._frame_id_to_message[frame_id_or_name]
-        elif isinstance(frame_id_or_name, str):
-            message = self._name_to_message[frame_id_or_name]
-        else:
-            raise ValueError(f"Invalid frame_id_or_name '{frame_id_or_name}'")
+        try:
+            message = self._lookup[frame_id_or_name]
+        except (KeyError, TypeError):
+            _check_frame_id_or_name(frame_id_or_name)
+
+            raise
+
+        # Other types, for example the float 74545.0, may still compare
+        # equal to a frame id in the lookup table.
+        if type(frame_id_or_name) not in (int, str):
+            _check_frame_id_or_name(frame_id_or_name)
 
         return message.encode(data, scaling, padding, strict)
 
@@ -421,15 +628,161 @@ class Database(object):
 
         """
 
-        if isinstance(frame_id_or_name, int):
-            message = self._frame_id_to_message[frame_id_or_name]
-        elif isinstance(frame_id_or_name, str):
-            message = self._name_to_message[frame_id_or_name]
-        else:
-            raise ValueError(f"Invalid frame_id_or_name '{frame_id_or_name}'")
+        try:
+            message = self._lookup[frame_id_or_name]
+        except (KeyError, TypeError):
+            _check_frame_id_or_name(frame_id_or_name)
+
+            raise
+
+        if type(frame_id_or_name) not in (int, str):
+            _check_frame_id_or_name(frame_id_or_name)
 
         return message.decode(data, decode_choices, scaling)
 
+    def encode_by_frame_id(self,
+                           frame_id: int,
+                           data: Dict[str, float],
+                           scaling: bool = True,
+                           padding: bool = False,
+                           strict: bool = True,
+                           ) -> bytes:
+        """Encode given signal data `data` as a message of given frame id
+        `frame_id`. Like :meth:`.encode_message()`, but faster as the
+        argument type is known. The frame id is masked as in
+        :meth:`.get_message_by_frame_id()`.
+
+        >>> db.encode_by_frame_id(158, {'Bar': 1, 'Fum': 5.0})
+        b'\\x01\\x45\\x23\\x00\\x11'
+
+        """
+
+        if self._mask_needed:
+            frame_id &= self._frame_id_mask
+
+        return self._frame_id_to_message[frame_id].encode(data,
+                                                          scaling,
+                                                          padding,
+                                                          strict)
+
+    def encode_by_name(self,
+                       name: str,
+                       data: Dict[str, float],
+                       scaling: bool = True,
+                       padding: bool = False,
+                       strict: bool = True,
+                       ) -> bytes:
+        """Encode given signal data `data` as a message of given name
+        `name`. Like :meth:`.encode_message()`, but faster as the
+        argument type is known.
+
+        >>> db.encode_by_name('Foo', {'Bar': 1, 'Fum': 5.0})
+        b'\\x01\\x45\\x23\\x00\\x11'
+
+        """
+
+        return self._name_to_message[name].encode(data,
+                                                  scaling,
+                                                  padding,
+                                                  strict)
+
+    def decode_by_frame_id(self,
+                           frame_id: int,
+                           data: bytes,
+                           decode_choices: bool = True,
+                           scaling: bool = True,
+                           ) -> Dict[str, Union[float, str]]:
+        """Decode given signal data `data` as a message of given frame id
+        `frame_id`. Like :meth:`.decode_message()`, but faster as the
+        argument type is known. The frame id is masked as in
+        :meth:`.get_message_by_frame_id()`.
+
+        >>> db.decode_by_frame_id(158, b'\\x01\\x45\\x23\\x00\\x11')
+        {'Bar': 1, 'Fum': 5.0}
+
+        """
+
+        if self._mask_needed:
+            frame_id &= self._frame_id_mask
+
+        return self._frame_id_to_message[frame_id].decode(data,
+                                                          decode_choices,
+                                                          scaling)
+
+    def decode_by_name(self,
+                       name: str,
+                       data: bytes,
+                       decode_choices: bool = True,
+                       scaling: bool = True,
+                       ) -> Dict[str, Union[float, str]]:
+        """Decode given signal data `data` as a message of given name
+        `name`. Like :meth:`.decode_message()`, but faster as the
+        argument type is known.
+
+        >>> db.decode_by_name('Foo', b'\\x01\\x45\\x23\\x00\\x11')
+        {'Bar': 1, 'Fum': 5.0}
+
+        """
+
+        return self._name_to_message[name].decode(data,
+                                                  decode_choices,
+                                                  scaling)
+
+    def decode_many(self,
+                    frame_ids_or_names: Iterable[Union[int, str]],
+                    datas: Iterable[bytes],
+                    decode_choices: bool = True,
+                    scaling: bool = True,
+                    ) -> List[Dict[str, Union[float, str]]]:
+        """Decode given signal datas `datas` as messages of given frame ids
+        or names `frame_ids_or_names`, pairwise. Returns a list with
+        one dictionary of signal name-value entries per message.
+
+        This is equivalent to calling :meth:`.decode_message()` once
+        per message, but faster when decoding many messages, for
+        example when replaying a log.
+
+        See :meth:`.decode_message()` for a description of
+        `decode_choices` and `scaling`.
+
+        Raises a ``ValueError`` if `frame_ids_or_names` and `datas`
+        have different lengths.
+
+        >>> db.decode_many([158, 'Foo'],
+        ...                [b'\\x01\\x45\\x23\\x00\\x11', b'\\x01\\x45\\x23\\x00\\x11'])
+        [{'Bar': 1, 'Fum': 5.0}, {'Bar': 1, 'Fum': 5.0}]
+
+        """
+
+        lookup = self._lookup
+        decoded = []
+        datas_iter = iter(datas)
+
+        for frame_id_or_name in frame_ids_or_names:
+            data = next(datas_iter, _MISSING)
+
+            if data is _MISSING:
+                break
+
+            try:
+                message = lookup[frame_id_or_name]
+            except (KeyError, TypeError):
+                _check_frame_id_or_name(frame_id_or_name)
+
+                raise
+
+            if type(frame_id_or_name) not in (int, str):
+                _check_frame_id_or_name(frame_id_or_name)
+
+            decoded.append(message.decode(cast(bytes, data),
+                                          decode_choices,
+                                          scaling))
+        else:
+            if next(datas_iter, _MISSING) is _MISSING:
+                return decoded
+
+        raise ValueError('frame_ids_or_names and datas have different lengths')
+
     def refresh(self) -> None:
         """Refresh the internal database state.
 
@@ -439,28 +792,91 @@ class Database(object):
 
         """
 
-        self._name_to_message = {}
-        self._frame_id_to_message = {}
+        self._refresh_all()
+
+    def _refresh_all(self) -> None:
+        """Rebuild the lookup tables from scratch, refreshing all messages.
+
+        """
 
         for message in self._messages:
             message.refresh(self._strict)
-            self._add_message(message)
+
+        self._build_message_lookup_tables()
+        self._refresh_nodes_and_buses()
+
+    def _build_message_lookup_tables(self) -> None:
+        """Build the message lookup tables from scratch. If any names or
+        frame ids are duplicated the messages are added one by one to
+        log which ones are overwritten.
+
+        """
+
+        messages = self._messages
+
+        # Interned names are found by identity when looking up messages
+        # by names given as string literals.
+        names = [_intern_name(message.name) for message in messages]
+
+        if self._mask_needed:
+            frame_ids = [
+                message.frame_id & self._frame_id_mask for message in messages
+            ]
+        else:
+            frame_ids = [message.frame_id for message in messages]
+
+        self._name_to_message = dict(zip(names, messages))
+        self._frame_id_to_message = dict(zip(frame_ids, messages))
+
+        if (len(self._name_to_message) != len(messages)
+            or len(self._frame_id_to_message) != len(messages)):
+            self._name_to_message = {}
+            self._frame_id_to_message = {}
+            self._lookup = {}
+
+            for message in messages:
+                self._add_message(message)
+        else:
+            lookup: Dict[Union[int, str], Message] = {}
+            lookup.update(self._frame_id_to_message.items())
+            lookup.update(self._name_to_message.items())
+            self._lookup = lookup
+
+    def _refresh_nodes_and_buses(self) -> None:
+        """Rebuild the node and bus lookup tables. The first node or bus
+        with a given name wins.
+
+        """
+
+        self._name_to_node = {
+            node.name: node for node in reversed(self._nodes)
+        }
+        self._name_to_bus = {
+            bus.name: bus for bus in reversed(self._buses)
+        }
 
     def __repr__(self) -> str:
-        lines = ["version('{}')".format(self._version), '']
+        buf = io.StringIO()
+        buf.write("version('{}')\n\n".format(self._version))
 
         if self._nodes:
             for node in self._nodes:
-                lines.append(repr(node))
+                buf.write(repr(node))
+                buf.write('\n')
 
-            lines.append('')
+            buf.write('\n')
 
         for message in self._messages:
-            lines.append(repr(message))
+            buf.write(repr(message))
+            buf.write('\n')
 
             for signal in message.signals:
-                lines.append('  ' + repr(signal))
+                buf.write('  ')
+                buf.write(repr(signal))
+                buf.write('\n')
 
-            lines.append('')
+            buf.write('\n')
 
-        return '\n'.join(lines)
+        # Every line above ends with a newline, but the last one should
+        # not.
+        return buf.getvalue()[:-1]
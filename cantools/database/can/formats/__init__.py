@@ -0,0 +1,19 @@
+import importlib
+import sys
+
+# The format modules are imported on first use. Import them on
+# attribute access as well, as in `cantools.db.can.formats.arxml`.
+# Module level __getattr__() requires Python 3.7 or later.
+if sys.version_info < (3, 7):
+    from . import arxml
+    from . import dbc
+    from . import kcd
+    from . import sym
+    from . import utils
+else:
+    def __getattr__(name):
+        if name in ['arxml', 'dbc', 'kcd', 'sym', 'utils']:
+            return importlib.import_module('.' + name, __name__)
+
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'")
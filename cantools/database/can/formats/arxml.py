@@ -2096,13 +2096,26 @@ def is_ecu_extract(root):
 
     return ecuc_value_collection is not None
 
+def load(fp, strict=True, encoding=None):
+    """Parse ARXML data from given file-like object. The data is parsed
+    as it is read, so the file is never kept in memory as a whole.
+
+    `encoding` overrides the encoding given in the XML declaration.
+
+    """
+
+    parser = ElementTree.XMLParser(encoding=encoding)
+
+    return _load_root(ElementTree.parse(fp, parser).getroot(), strict)
+
 def load_string(string, strict=True):
     """Parse given ARXML format string.
 
     """
 
-    root = ElementTree.fromstring(string)
+    return _load_root(ElementTree.fromstring(string), strict)
 
+def _load_root(root, strict):
     m = re.match(r'{(.*)}AUTOSAR', root.tag)
     if not m:
         raise ValueError(f"No XML namespace specified or illegal root tag name '{root.tag}'")
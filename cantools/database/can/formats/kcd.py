@@ -451,13 +451,28 @@ def dump_string(database: InternalDatabase) -> str:
     return ElementTree.tostring(network_definition, encoding='unicode')
 
 
+def load(fp, strict=True, encoding=None):
+    """Parse KCD data from given file-like object. The data is parsed as
+    it is read, so the file is never kept in memory as a whole.
+
+    `encoding` overrides the encoding given in the XML declaration.
+
+    """
+
+    parser = ElementTree.XMLParser(encoding=encoding)
+
+    return _load_root(ElementTree.parse(fp, parser).getroot(), strict)
+
+
 def load_string(string, strict=True):
     """Parse given KCD format string.
 
     """
 
-    root = ElementTree.fromstring(string)
+    return _load_root(ElementTree.fromstring(string), strict)
+
 
+def _load_root(root, strict):
     # Should be replaced with a validation using the XSD file.
     if root.tag != ROOT_TAG:
         raise ValueError(
@@ -12,6 +12,8 @@ import re
 import logging
 from xml.etree import ElementTree
 import timeit
+import tempfile
+import diskcache
 
 try:
     from StringIO import StringIO
@@ -305,6 +307,91 @@ class CanToolsDatabaseTest(unittest.TestCase):
             decoded = db.decode_message(name, encoded)
             self.assertEqual(decoded, decoded_message)
 
+        with self.assertRaises(KeyError):
+            db.encode_message('Missing', {})
+
+        with self.assertRaises(KeyError):
+            db.decode_message(0x7ff, b'')
+
+        with self.assertRaises(ValueError) as cm:
+            db.encode_message(None, {})
+
+        self.assertEqual(str(cm.exception), "Invalid frame_id_or_name 'None'")
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_message([1], b'')
+
+        self.assertEqual(str(cm.exception), "Invalid frame_id_or_name '[1]'")
+
+        # Fum has frame id 0x12331, which compares equal to 74545.0.
+        with self.assertRaises(ValueError) as cm:
+            db.encode_message(74545.0, {'Fum': 1, 'Fam': 1})
+
+        self.assertEqual(str(cm.exception),
+                         "Invalid frame_id_or_name '74545.0'")
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_message(74545.0, b'\x01\x10\x00\x00\x00')
+
+        self.assertEqual(str(cm.exception),
+                         "Invalid frame_id_or_name '74545.0'")
+
+    def test_foobar_decode_many(self):
+        db = cantools.db.Database()
+        db.add_dbc_file('tests/files/dbc/foobar.dbc')
+
+        decoded = db.decode_many(
+            [0x12331, 'Bar', 0x12331],
+            [b'\x09\x50\x00\x00\x00', b'\x00\x00\x80\x3f', b'\x01\x10\x00\x00\x00'])
+        self.assertEqual(decoded,
+                         [
+                             {'Fum': 9, 'Fam': 5},
+                             {'Binary32': 1.0},
+                             {'Fum': 1, 'Fam': 'Enabled'}
+                         ])
+
+        decoded = db.decode_many([0x12331],
+                                 [b'\x01\x10\x00\x00\x00'],
+                                 decode_choices=False)
+        self.assertEqual(decoded, [{'Fum': 1, 'Fam': 1}])
+        self.assertEqual(db.decode_many([], []), [])
+
+        with self.assertRaises(KeyError):
+            db.decode_many([0x12331, 0x7ff], 2 * [b'\x00\x00\x00\x00\x00'])
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_many([0x12331, 0x12331], [b'\x09\x50\x00\x00\x00'])
+
+        self.assertEqual(str(cm.exception),
+                         'frame_ids_or_names and datas have different lengths')
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_many(iter([0x12331]), 2 * [b'\x09\x50\x00\x00\x00'])
+
+        self.assertEqual(str(cm.exception),
+                         'frame_ids_or_names and datas have different lengths')
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_many([0x12331], [b'\x09\x50\x00\x00\x00', None])
+
+        self.assertEqual(str(cm.exception),
+                         'frame_ids_or_names and datas have different lengths')
+
+        # A None payload is passed on to the message, as by decode_message().
+        with self.assertRaises(TypeError):
+            db.decode_many([0x12331], [None])
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_many([None], [b''])
+
+        self.assertEqual(str(cm.exception), "Invalid frame_id_or_name 'None'")
+
+        with self.assertRaises(ValueError) as cm:
+            db.decode_many([74545.0], [b'\x01\x10\x00\x00\x00'])
+
+        self.assertEqual(str(cm.exception),
+                         "Invalid frame_id_or_name '74545.0'")
+
     def test_foobar_encode_decode_frame_ids(self):
         db = cantools.db.Database()
         db.add_dbc_file('tests/files/dbc/foobar.dbc')
@@ -344,6 +431,21 @@ class CanToolsDatabaseTest(unittest.TestCase):
             self.assertEqual(encoded, encoded_message)
             decoded = db.decode_message(frame_id, encoded)
             self.assertEqual(decoded, decoded_message)
+            encoded = db.encode_by_frame_id(frame_id, decoded_message)
+            self.assertEqual(encoded, encoded_message)
+            decoded = db.decode_by_frame_id(frame_id, encoded)
+            self.assertEqual(decoded, decoded_message)
+            name = db.get_message_by_frame_id(frame_id).name
+            encoded = db.encode_by_name(name, decoded_message)
+            self.assertEqual(encoded, encoded_message)
+            decoded = db.decode_by_name(name, encoded)
+            self.assertEqual(decoded, decoded_message)
+
+        with self.assertRaises(KeyError):
+            db.encode_by_frame_id(0x7ff, {})
+
+        with self.assertRaises(KeyError):
+            db.decode_by_name('Missing', b'')
 
     def test_foobar_decode_masked_frame_id(self):
         db = cantools.db.Database(frame_id_mask=0xff)
@@ -357,6 +459,7 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         for frame_id in frame_ids:
             db.get_message_by_frame_id(frame_id)
+            db.decode_by_frame_id(frame_id, b'\x09\x50\x00\x00\x00')
 
     def test_dbc_dump_val_table(self):
         filename = 'tests/files/dbc/val_table.dbc'
@@ -2742,6 +2845,11 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), "'Missing'")
 
+        # Nodes appended to the list are found without a refresh.
+        node = cantools.db.Node('New')
+        db.nodes.append(node)
+        self.assertIs(db.get_node_by_name('New'), node)
+
     def test_get_bus_by_name(self):
         db = cantools.db.load_file('tests/files/kcd/the_homer.kcd')
 
@@ -2752,6 +2860,27 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), "'Missing'")
 
+        # Buses appended to the list are found without a refresh.
+        bus = cantools.database.can.bus.Bus('New')
+        db.buses.append(bus)
+        self.assertIs(db.get_bus_by_name('New'), bus)
+
+    def test_load_file_cache(self):
+        filename = 'tests/files/dbc/foobar.dbc'
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # An entry as written by earlier versions, keyed by the file
+            # contents only, must not be used.
+            with open(filename, 'rb') as fin:
+                with diskcache.Cache(cache_dir) as cache:
+                    cache[fin.read()] = 'Stale'
+
+            db = cantools.database.load_file(filename, cache_dir=cache_dir)
+            self.assertEqual(db.get_message_by_frame_id(0x12331).name, 'Fum')
+            db = cantools.database.load_file(filename, cache_dir=cache_dir)
+            self.assertEqual(db.encode_message('Fum', {'Fum': 9, 'Fam': 5}),
+                             b'\x09\x50\x00\x00\x00')
+
     def test_load_file_with_database_format(self):
         filename_dbc = 'tests/files/dbc/foobar.dbc'
         filename_kcd = 'tests/files/kcd/the_homer.kcd'
@@ -3201,6 +3330,74 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         self.assertEqual(cm.exception.args[0], 0x41)
 
+    def test_refresh_modified_signal(self):
+        """Test that refresh() refreshes messages modified in place, also if
+        not strict.
+
+        """
+
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                         strict=False)
+        message = db.get_message_by_name('Fum')
+        data = {'Fum': 9, 'Fam': 5}
+        self.assertEqual(db.encode_message('Fum', data),
+                         b'\x09\x50\x00\x00\x00')
+
+        message.get_signal_by_name('Fam').start = 16
+        db.refresh()
+        self.assertEqual(db.encode_message('Fum', data),
+                         b'\x09\x00\x05\x00\x00')
+
+    def test_refresh_duplicated_messages(self):
+        messages = [
+            cantools.db.Message(0x20, 'A', 8, []),
+            cantools.db.Message(0x21, 'A', 8, []),
+            cantools.db.Message(0x21, 'B', 8, [])
+        ]
+
+        with self.assertLogs('cantools.database.can.database') as cm:
+            db = cantools.db.Database(messages)
+
+        self.assertEqual(
+            cm.output,
+            [
+                "WARNING:cantools.database.can.database:Overwriting message "
+                "'A' with 'A' in the name to message dictionary.",
+                "WARNING:cantools.database.can.database:Overwriting message "
+                "'A' with 'B' in the frame id to message dictionary because "
+                "they have identical masked frame ids 0x21."
+            ])
+        self.assertIs(db.get_message_by_name('A'), messages[1])
+        self.assertIs(db.get_message_by_name('B'), messages[2])
+        self.assertIs(db.get_message_by_frame_id(0x20), messages[0])
+        self.assertIs(db.get_message_by_frame_id(0x21), messages[2])
+        self.assertEqual(db.encode_message(0x21, {}), 8 * b'\x00')
+
+    def test_message_name_str_subclass(self):
+        """Test that message names may be of a subclass of str, which
+        cannot be interned.
+
+        """
+
+        class Name(str):
+            pass
+
+        message = cantools.db.Message(0x20, Name('A'), 8, [])
+        db = cantools.db.Database([message])
+        self.assertIs(db.get_message_by_name('A'), message)
+        self.assertEqual(db.encode_message('A', {}), 8 * b'\x00')
+
+        # Duplicated names add the messages one by one.
+        messages = [
+            cantools.db.Message(0x20, Name('A'), 8, []),
+            cantools.db.Message(0x21, Name('A'), 8, [])
+        ]
+
+        with self.assertLogs('cantools.database.can.database'):
+            db = cantools.db.Database(messages)
+
+        self.assertIs(db.get_message_by_name('A'), messages[1])
+
     def test_missing_dbc_specifics(self):
         db = cantools.db.Database()
 
@@ -3570,12 +3767,171 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(len(db.messages), 2)
         self.assertEqual(db.get_message_by_name('M1').frame_id, 1)
         self.assertEqual(db.get_message_by_frame_id(2).name, 'M2')
+        codecs = [message._codecs for message in db.messages]
 
         db.add_dbc_file('tests/files/dbc/add_two_dbc_files_2.dbc')
         self.assertEqual(len(db.messages), 3)
         self.assertEqual(db.get_message_by_name('M1').frame_id, 2)
         self.assertEqual(db.get_message_by_frame_id(2).name, 'M1')
 
+        # Messages already in the database are not refreshed again.
+        for message, message_codecs in zip(db.messages, codecs):
+            self.assertIs(message._codecs, message_codecs)
+
+    def test_add_files(self):
+        db = cantools.database.Database()
+        db.add_files(['tests/files/dbc/add_two_dbc_files_1.dbc',
+                      'tests/files/dbc/add_two_dbc_files_2.dbc'],
+                     'dbc')
+        self.assertEqual(len(db.messages), 3)
+        self.assertEqual(db.get_message_by_name('M1').frame_id, 2)
+        self.assertEqual(db.get_message_by_frame_id(2).name, 'M1')
+
+        db = cantools.database.Database()
+
+        with self.assertLogs('cantools.database.can.database') as cm:
+            db.add_files(['tests/files/kcd/the_homer.kcd'], 'kcd')
+
+        self.assertEqual(
+            cm.output,
+            [
+                "WARNING:cantools.database.can.database:Overwriting message "
+                "'SteeringInfo' with 'DriverSeat' in the frame id to message "
+                "dictionary because they have identical masked frame ids "
+                "0x55b."
+            ])
+        self.assertEqual(len(db.messages), 33)
+        self.assertEqual(db.get_message_by_frame_id(0x55b).name, 'DriverSeat')
+
+        with self.assertRaises(ValueError) as cm:
+            db.add_files([], 'foo')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected database format 'arxml', 'dbc', 'kcd' or 'sym', but got "
+            "'foo'")
+
+    def test_add_string(self):
+        db = cantools.database.Database()
+
+        with open('tests/files/dbc/add_two_dbc_files_1.dbc') as fin:
+            db.add_string(fin.read(), 'dbc')
+
+        with open('tests/files/kcd/the_homer.kcd') as fin:
+            db.add_string(fin.read(), 'kcd')
+
+        self.assertEqual(len(db.messages), 35)
+        self.assertEqual(db.get_message_by_name('M1').frame_id, 1)
+        self.assertEqual(db.get_message_by_name('Airbag').frame_id, 0xa)
+
+        with self.assertRaises(ValueError) as cm:
+            db.add_string('', 'cdd')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected database format 'arxml', 'dbc', 'kcd' or 'sym', but got "
+            "'cdd'")
+
+    def test_add_bytes(self):
+        for filename, database_format in [
+                ('tests/files/arxml/system-4.2.arxml', 'arxml'),
+                ('tests/files/kcd/the_homer.kcd', 'kcd'),
+                ('tests/files/dbc/foobar.dbc', 'dbc'),
+                ('tests/files/sym/jopp-6.0.sym', 'sym')
+        ]:
+            expected = cantools.database.load_file(filename,
+                                                   prune_choices=False)
+
+            with open(filename, 'rb') as fin:
+                string = fin.read()
+
+            db = cantools.database.Database()
+            db.add_string(string, database_format)
+            self.assertEqual(repr(db), repr(expected))
+
+            db = cantools.database.Database()
+            getattr(db, f'add_{database_format}_string')(string)
+            self.assertEqual(repr(db), repr(expected))
+
+            db = cantools.database.Database()
+            getattr(db, f'add_{database_format}_file')(filename)
+            self.assertEqual(repr(db), repr(expected))
+
+    def test_add_kcd_file_invalid_byte(self):
+        """Test that invalid bytes in KCD files are replaced, both by
+        add_kcd_file() and load_file().
+
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'invalid_byte.kcd')
+
+            with open(filename, 'wb') as fout:
+                fout.write(
+                    b'<NetworkDefinition '
+                    b'xmlns="http://kayak.2codeornot2code.org/1.0">\n'
+                    b'  <Document version="caf\xe9"/>\n'
+                    b'</NetworkDefinition>\n')
+
+            db = cantools.database.Database()
+            db.add_kcd_file(filename)
+            self.assertEqual(db.version, 'caf\ufffd')
+
+            db = cantools.database.load_file(filename)
+            self.assertEqual(db.version, 'caf\ufffd')
+
+    def test_add_arxml_file_invalid_byte(self):
+        """Test that invalid bytes in ARXML files are replaced, both by
+        add_arxml_file() and load_file().
+
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'invalid_byte.arxml')
+
+            with open(filename, 'wb') as fout:
+                fout.write(
+                    b'<AUTOSAR xmlns="http://autosar.org/schema/r4.0">\n'
+                    b'  <AR-PACKAGES><AR-PACKAGE><SHORT-NAME>P</SHORT-NAME>\n'
+                    b'    <ELEMENTS><ECU-INSTANCE>\n'
+                    b'      <SHORT-NAME>caf\xe9</SHORT-NAME>\n'
+                    b'    </ECU-INSTANCE></ELEMENTS>\n'
+                    b'  </AR-PACKAGE></AR-PACKAGES>\n'
+                    b'</AUTOSAR>\n')
+
+            db = cantools.database.Database()
+            db.add_arxml_file(filename)
+            self.assertEqual(db.nodes[0].name, 'caf\ufffd')
+
+            db = cantools.database.load_file(filename)
+            self.assertEqual(db.nodes[0].name, 'caf\ufffd')
+
+    def test_add_arxml_file_multi_byte_encoding(self):
+        """Test that ARXML files may use a multi-byte encoding other than
+        UTF-8.
+
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'gbk.arxml')
+
+            with open(filename, 'w', encoding='gbk') as fout:
+                fout.write(
+                    '<AUTOSAR xmlns="http://autosar.org/schema/r4.0">\n'
+                    '  <AR-PACKAGES><AR-PACKAGE><SHORT-NAME>P</SHORT-NAME>\n'
+                    '    <ELEMENTS><ECU-INSTANCE>\n'
+                    '      <SHORT-NAME>\u6c7d\u8f66</SHORT-NAME>\n'
+                    '    </ECU-INSTANCE></ELEMENTS>\n'
+                    '  </AR-PACKAGE></AR-PACKAGES>\n'
+                    '</AUTOSAR>\n')
+
+            db = cantools.database.Database()
+            db.add_arxml_file(filename, encoding='gbk')
+            self.assertEqual(db.nodes[0].name, '\u6c7d\u8f66')
+
+            db = cantools.database.load_file(filename, encoding='gbk')
+            self.assertEqual(db.nodes[0].name, '\u6c7d\u8f66')
+
     def test_empty_ns_dbc(self):
         """Test loading a DBC-file with empty NS_.
 
@@ -4923,6 +5279,21 @@ class CanToolsDatabaseTest(unittest.TestCase):
             str(cm.exception),
             'ARXML: "No XML namespace specified or illegal root tag name \'{http://autosar.org/schema/r4.0}NOT-AUTOSAR\'"')
 
+    def test_add_arxml_file_and_fp(self):
+        filename = 'tests/files/arxml/system-4.2.arxml'
+        expected = cantools.database.load_file(filename, prune_choices=False)
+
+        db = cantools.database.Database()
+        db.add_arxml_file(filename)
+        self.assertEqual(repr(db), repr(expected))
+
+        db = cantools.database.Database()
+
+        with open(filename, 'r', encoding='utf-8') as fin:
+            db.add_arxml(fin)
+
+        self.assertEqual(repr(db), repr(expected))
+
     def test_ecu_extract_arxml(self):
         db = cantools.database.Database()
         db.add_arxml_file('tests/files/arxml/ecu-extract-4.2.arxml')